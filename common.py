@@ -10,13 +10,21 @@ import os
 import time
 import re
 import csv
-import json
-from datetime import datetime
+import hashlib
+import html
+import sqlite3
+import threading
+import traceback
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 import asyncio
 
+import httpx
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
 from openai import OpenAI
 
 # Google Sheets용
@@ -28,6 +36,14 @@ except ImportError:
     GSPREAD_AVAILABLE = False
     logging.warning("gspread not installed. Google Sheets logging disabled.")
 
+# 키워드 매칭용 (없으면 정규식으로 대체)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    logging.warning("pyahocorasick not installed. Using regex keyword matching.")
+
 # ================================================================================
 # 환경변수
 # ================================================================================
@@ -40,6 +56,25 @@ GOOGLE_SHEETS_SPREADSHEET_ID = os.getenv("GOOGLE_SHEETS_SPREADSHEET_ID")
 
 CSV_FILE_PATH = "news_data.csv"
 
+# CSV / Google Sheets 컬럼 순서
+NEWS_COLUMNS = [
+    'timestamp', 'title', 'description', 'url',
+    'is_relevant', 'relevance_score', 'keywords', 'region',
+    'has_price', 'has_policy', 'reason', 'user_id'
+]
+
+# 크론 크롤러용 OpenAI Batch API 사용 여부 / 최대 대기 시간(초)
+# 대기 시간은 한 실행 안의 모든 배치(필터 + 요약)가 나눠 쓰는 전체 예산이므로
+# 크론 주기(render.yaml: 5분)보다 충분히 짧게 유지할 것
+OPENAI_USE_BATCH_API = os.getenv("OPENAI_USE_BATCH_API", "").lower() in ("1", "true", "yes")
+OPENAI_BATCH_MAX_WAIT = int(os.getenv("OPENAI_BATCH_MAX_WAIT", "240"))
+
+# GPT 응답 캐시 (sqlite)
+# 로컬 파일이므로 실행 간 작업 디렉터리가 유지될 때만 효과가 있음
+# (Render cron처럼 매 실행 새 파일시스템이면 해당 실행 안에서만 재사용됨)
+CACHE_DB_PATH = os.getenv("CACHE_DB_PATH", "gpt_cache.sqlite3")
+FILTER_CACHE_TTL = 24 * 60 * 60  # 필터 판정 캐시 유효기간 (초)
+
 # ================================================================================
 # 글로벌 변수
 # ================================================================================
@@ -47,56 +82,302 @@ CSV_FILE_PATH = "news_data.csv"
 gsheet_client = None
 gsheet_worksheet = None
 
+# 최근 저장된 URL (처음 조회 시 시트에서 한 번 로드, 이후 저장할 때마다 추가)
+_recent_url_index = None
+
+# Batch API 전체 대기 마감 시각 (time.monotonic 기준, start_batch_budget()으로 설정)
+_batch_deadline = None
+
+# 기사마다 새로 만들지 않고 재사용 (keep-alive로 TLS 핸드셰이크 절약)
+_openai_client = OpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
+
+_http = requests.Session()
+_http.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False  # 재시도 소진 시 응답을 그대로 반환 → raise_for_status()로 처리
+    )
+))
+
+# 네이버 검색 API용 비동기 클라이언트 (HTTP/2 keep-alive, 연결 실패는 transport가 재시도)
+# transport를 직접 넘기면 클라이언트의 http2/limits는 무시되므로 transport에 지정
+_async_http = httpx.AsyncClient(
+    timeout=httpx.Timeout(5.0, connect=3.0),
+    transport=httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_connections=20)
+    )
+)
+SEARCH_RETRY_STATUS = {429, 500, 502, 503, 504}
+SEARCH_MAX_RETRIES = 2
+
 logger = logging.getLogger(__name__)
 
+# ================================================================================
+# GPT 응답 캐시
+# ================================================================================
+
+_cache_conn = None
+_cache_lock = threading.Lock()
+
+def _get_cache_conn():
+    global _cache_conn
+    if _cache_conn is None:
+        _cache_conn = sqlite3.connect(CACHE_DB_PATH, check_same_thread=False)
+        _cache_conn.execute(
+            "CREATE TABLE IF NOT EXISTS gpt_cache ("
+            "namespace TEXT, key TEXT, value TEXT, ts INTEGER, "
+            "PRIMARY KEY (namespace, key))"
+        )
+    return _cache_conn
+
+def cache_get(namespace: str, key: str, ttl: int):
+    """
+    캐시 조회
+    
+    Args:
+        namespace: 캐시 구분 (예: 'filter')
+        key: 캐시 키
+        ttl: 유효기간 (초)
+    
+    Returns:
+        저장된 값 (없거나 만료됐으면 None)
+    """
+    try:
+        with _cache_lock:
+            row = _get_cache_conn().execute(
+                "SELECT value FROM gpt_cache WHERE namespace = ? AND key = ? AND ts >= ?",
+                (namespace, key, int(time.time()) - ttl)
+            ).fetchone()
+        return orjson.loads(row[0]) if row else None
+    except Exception as e:
+        logger.warning(f"⚠️ 캐시 조회 실패: {e}")
+        return None
+
+def cache_set(namespace: str, key: str, value):
+    """캐시 저장 (JSON 직렬화 가능한 값)"""
+    try:
+        with _cache_lock:
+            conn = _get_cache_conn()
+            conn.execute(
+                "INSERT OR REPLACE INTO gpt_cache (namespace, key, value, ts) VALUES (?, ?, ?, ?)",
+                (namespace, key, orjson.dumps(value).decode(), int(time.time()))
+            )
+            conn.commit()
+    except Exception as e:
+        logger.warning(f"⚠️ 캐시 저장 실패: {e}")
+
 # ================================================================================
 # 뉴스 필터링 시스템
 # ================================================================================
 
-def is_headline_news(title: str, description: str) -> bool:
+# 헤드라인 패턴 키워드
+HEADLINE_KEYWORDS = [
+    "오늘의 부동산 뉴스",
+    "오늘의 뉴스",
+    "부동산 뉴스 총정리",
+    "헤드라인",
+    "뉴스 브리핑",
+    "뉴스 모음",
+    "주요 뉴스",
+    "뉴스 정리",
+]
+
+# 패턴 매칭: "뉴스 (총 N건)", "총 N건의 뉴스" 등
+_HEADLINE_PATTERN = re.compile(
+    r'뉴스\s*\(총\s*\d+건\)'   # 뉴스 (총 5건)
+    r'|총\s*\d+건'              # 총 5건
+    r'|\d+건의?\s*뉴스'         # 5건의 뉴스
+)
+
+# 연예인 키워드
+CELEBRITY_KEYWORDS = [
+    "배우", "가수", "연예인", "아이돌", "탤런트",
+    "스타", "셀럽", "방송인", "코미디언", "개그맨"
+]
+
+# 부동산 거래 키워드 (포함 OK)
+TRANSACTION_KEYWORDS = [
+    "매매", "매입", "구입", "구매", "취득", "샀다", "사들",
+    "매도", "판매", "처분", "팔았다", "팔아",
+    "억원에", "억대", "억원대",
+    "투자", "분양", "입주",
+    "새집", "이사"
+]
+
+# 분쟁/스캔들 키워드 (제외)
+SCANDAL_KEYWORDS = [
+    "분쟁", "갈등", "소송", "고소", "고발",
+    "혐의", "의혹", "논란", "폭로",
+    "사기", "횡령", "배임",
+    "전 남편", "전 부인", "이혼", "위자료"
+]
+
+# 키워드 필터링 (GPT 폴백)
+REAL_ESTATE_KEYWORDS = [
+    "아파트", "오피스텔", "빌딩", "상가", "토지", "주택",
+    "매매", "전세", "월세", "분양", "청약", "입주",
+    "재건축", "재개발", "정비구역", "부동산", "집값",
+    "주택가격", "전세가", "시세", "주담대", "종부세",
+    "양도세", "취득세", "국토부", "미분양"
+]
+
+EXCLUDE_KEYWORDS = ["주식", "코인", "비트코인", "펀드", "채권"]
+
+PRICE_KEYWORDS = ['가격', '시세', '억', '만원', '상승', '하락']
+
+POLICY_KEYWORDS = ['정책', '규제', '세금', '대출', '금리']
+
+# 지역 (우선순위: 서울 구 > 경기 시 > 광역시)
+SEOUL_GU = [
+    "강남구", "강동구", "강북구", "강서구", "관악구",
+    "광진구", "구로구", "금천구", "노원구", "도봉구",
+    "동대문구", "동작구", "마포구", "서대문구", "서초구",
+    "성동구", "성북구", "송파구", "양천구", "영등포구",
+    "용산구", "은평구", "종로구", "중구", "중랑구"
+]
+
+GYEONGGI_CITIES = [
+    "성남시", "용인시", "수원시", "고양시", "화성시",
+    "평택시", "부천시", "안양시", "남양주시"
+]
+
+METROPOLITAN = ["인천", "부산", "대구", "대전", "광주", "울산", "세종"]
+
+# 지역명 → (우선순위, 목록 내 순서, 표시 이름) - 작을수록 우선
+_REGION_PRIORITY = {
+    **{gu: (0, idx, f"서울 {gu}") for idx, gu in enumerate(SEOUL_GU)},
+    **{city: (1, idx, f"경기 {city}") for idx, city in enumerate(GYEONGGI_CITIES)},
+    **{metro: (2, idx, metro) for idx, metro in enumerate(METROPOLITAN)},
+}
+
+_KEYWORD_GROUPS = {
+    'headline': HEADLINE_KEYWORDS,
+    'celebrity': CELEBRITY_KEYWORDS,
+    'transaction': TRANSACTION_KEYWORDS,
+    'scandal': SCANDAL_KEYWORDS,
+    'real_estate': REAL_ESTATE_KEYWORDS,
+    'exclude': EXCLUDE_KEYWORDS,
+    'price': PRICE_KEYWORDS,
+    'policy': POLICY_KEYWORDS,
+    'seoul': SEOUL_GU,
+    'gyeonggi': GYEONGGI_CITIES,
+    'metro': METROPOLITAN,
+}
+
+
+def _build_keyword_automaton():
+    """모든 키워드 그룹을 하나의 Aho-Corasick 오토마톤으로 구성"""
+    groups_by_keyword = {}
+    for group, keywords in _KEYWORD_GROUPS.items():
+        for kw in keywords:
+            groups_by_keyword.setdefault(kw, []).append(group)
+    
+    automaton = ahocorasick.Automaton()
+    for kw, groups in groups_by_keyword.items():
+        automaton.add_word(kw, (kw, tuple(groups)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_keyword_regex(keywords: list) -> tuple:
+    """
+    키워드 그룹 하나를 단일 정규식으로 구성 (pyahocorasick 없을 때)
+    
+    긴 키워드부터 나열한 lookahead 패턴이라 각 위치에서 시작하는 가장 긴 키워드가
+    잡히고, 같은 위치에서 시작하는 짧은 키워드(예: 주택가격 → 주택)는 prefixes로 보충
+    
+    Returns:
+        (정규식, {키워드: 해당 키워드로 시작하는 모든 키워드 집합})
+    """
+    ordered = sorted(set(keywords), key=len, reverse=True)
+    pattern = re.compile('(?=(' + '|'.join(map(re.escape, ordered)) + '))')
+    prefixes = {kw: {other for other in ordered if kw.startswith(other)} for kw in ordered}
+    return pattern, prefixes
+
+
+_KEYWORD_AC = _build_keyword_automaton() if AHOCORASICK_AVAILABLE else None
+
+_KEYWORD_RES = None if AHOCORASICK_AVAILABLE else {
+    group: _build_keyword_regex(keywords)
+    for group, keywords in _KEYWORD_GROUPS.items()
+}
+
+
+def _match_keywords(text: str, groups: Optional[tuple] = None) -> dict:
+    """
+    텍스트를 한 번 훑어 포함된 키워드를 그룹별로 수집
+    
+    Args:
+        text: 검사할 텍스트
+        groups: 수집할 그룹 (없으면 전체)
+    
+    Returns:
+        {그룹명: 포함된 키워드 집합} - 매칭 없는 그룹은 생략
+    """
+    hits = {}
+    
+    if _KEYWORD_AC is not None:
+        for _, (kw, kw_groups) in _KEYWORD_AC.iter(text):
+            for group in kw_groups:
+                if groups is None or group in groups:
+                    hits.setdefault(group, set()).add(kw)
+    else:
+        for group in groups or _KEYWORD_RES:
+            pattern, prefixes = _KEYWORD_RES[group]
+            found = set()
+            for kw in pattern.findall(text):
+                found |= prefixes[kw]
+            if found:
+                hits[group] = found
+    
+    return hits
+
+
+def _has_keyword(text: str, group: str) -> bool:
+    """그룹 키워드가 하나라도 있는지 확인 (첫 매칭에서 바로 종료)"""
+    if _KEYWORD_AC is not None:
+        return any(group in kw_groups for _, (_, kw_groups) in _KEYWORD_AC.iter(text))
+    return _KEYWORD_RES[group][0].search(text) is not None
+
+
+def _prep(title: str, description: str) -> str:
+    """필터 함수들이 공통으로 검사하는 텍스트 (제목 + 설명, 소문자)"""
+    return (title + " " + description).lower()
+
+
+def is_headline_news(title: str, description: str, text: Optional[str] = None) -> bool:
     """
     헤드라인/종합 뉴스인지 판단
     
+    Args:
+        text: 이미 계산한 _prep(title, description) (없으면 새로 계산)
+    
     Returns:
         True: 헤드라인 뉴스 (제외 대상)
         False: 일반 뉴스
     """
-    text = (title + " " + description).lower()
-    
-    # 헤드라인 패턴 키워드
-    headline_keywords = [
-        "오늘의 부동산 뉴스",
-        "오늘의 뉴스",
-        "부동산 뉴스 총정리",
-        "헤드라인",
-        "뉴스 브리핑",
-        "뉴스 모음",
-        "주요 뉴스",
-        "뉴스 정리",
-    ]
-    
-    for keyword in headline_keywords:
-        if keyword in text:
-            return True
-    
-    # 패턴 매칭: "뉴스 (총 N건)", "총 N건의 뉴스" 등
-    patterns = [
-        r'뉴스\s*\(총\s*\d+건\)',  # 뉴스 (총 5건)
-        r'총\s*\d+건',             # 총 5건
-        r'\d+건의?\s*뉴스',        # 5건의 뉴스
-    ]
+    if text is None:
+        text = _prep(title, description)
     
-    for pattern in patterns:
-        if re.search(pattern, text):
-            return True
+    if _has_keyword(text, 'headline'):
+        return True
     
-    return False
+    return bool(_HEADLINE_PATTERN.search(text))
 
 
-def check_celebrity_scandal(title: str, description: str) -> dict:
+def check_celebrity_scandal(title: str, description: str, text: Optional[str] = None) -> dict:
     """
     연예인 관련 뉴스의 부동산 관련성 판단
     
+    Args:
+        text: 이미 계산한 _prep(title, description) (없으면 새로 계산)
+    
     Returns:
         {
             'is_celebrity_news': bool,
@@ -104,43 +385,20 @@ def check_celebrity_scandal(title: str, description: str) -> dict:
             'reason': str
         }
     """
-    text = (title + " " + description).lower()
-    
-    # 연예인 키워드
-    celebrity_keywords = [
-        "배우", "가수", "연예인", "아이돌", "탤런트",
-        "스타", "셀럽", "방송인", "코미디언", "개그맨"
-    ]
-    
-    # 부동산 거래 키워드 (포함 OK)
-    transaction_keywords = [
-        "매매", "매입", "구입", "구매", "취득", "샀다", "사들",
-        "매도", "판매", "처분", "팔았다", "팔아",
-        "억원에", "억대", "억원대",
-        "투자", "분양", "입주",
-        "새집", "이사"
-    ]
-    
-    # 분쟁/스캔들 키워드 (제외)
-    scandal_keywords = [
-        "분쟁", "갈등", "소송", "고소", "고발",
-        "혐의", "의혹", "논란", "폭로", "고발",
-        "사기", "횡령", "배임",
-        "전 남편", "전 부인", "이혼", "위자료"
-    ]
-    
-    is_celebrity = any(kw in text for kw in celebrity_keywords)
-    has_transaction = any(kw in text for kw in transaction_keywords)
-    has_scandal = any(kw in text for kw in scandal_keywords)
-    
-    # 연예인 뉴스가 아니면 패스
-    if not is_celebrity:
+    if text is None:
+        text = _prep(title, description)
+    # 연예인 뉴스가 아니면 패스 (대부분의 기사는 여기서 끝)
+    if not _has_keyword(text, 'celebrity'):
         return {
             'is_celebrity_news': False,
             'should_exclude': False,
             'reason': '연예인 뉴스 아님'
         }
     
+    hits = _match_keywords(text, groups=('transaction', 'scandal'))
+    has_transaction = 'transaction' in hits
+    has_scandal = 'scandal' in hits
+    
     # 연예인 + 분쟁/스캔들 = 제외
     if has_scandal:
         return {
@@ -165,61 +423,44 @@ def check_celebrity_scandal(title: str, description: str) -> dict:
     }
 
 
-def filter_real_estate_news(title: str, description: str) -> dict:
+def _excluded_result(reason: str) -> dict:
+    """사전 필터링으로 제외된 기사의 판정 결과"""
+    return {
+        'is_relevant': False,
+        'relevance_score': 0,
+        'keywords': [],
+        'region': None,
+        'has_price': False,
+        'has_policy': False,
+        'reason': reason
+    }
+
+
+def _prefilter_news(title: str, description: str) -> Optional[dict]:
     """
-    기사가 부동산과 관련이 있는지 GPT로 판단하고 핵심 지표 추출
+    GPT 호출 전 사전 필터링 (헤드라인, 연예인 분쟁, 키워드 확정 판정)
     
     Returns:
-        {
-            'is_relevant': bool,
-            'relevance_score': int,
-            'keywords': list,
-            'region': str or None,
-            'has_price': bool,
-            'has_policy': bool,
-            'reason': str
-        }
+        GPT 없이 판정되면 판정 결과, 아니면 None (GPT 판단 필요)
     """
+    text = _prep(title, description)
     
-    # ============================================================
     # 1단계: 헤드라인 뉴스 사전 필터링
-    # ============================================================
-    if is_headline_news(title, description):
-        logging.info(f"❌ [헤드라인 제외] {title[:50]}...")
-        return {
-            'is_relevant': False,
-            'relevance_score': 0,
-            'keywords': [],
-            'region': None,
-            'has_price': False,
-            'has_policy': False,
-            'reason': '헤드라인/종합 뉴스'
-        }
+    if is_headline_news(title, description, text):
+        logging.info("❌ [헤드라인 제외] %s...", title[:50])
+        return _excluded_result('헤드라인/종합 뉴스')
     
-    # ============================================================
     # 2단계: 연예인 분쟁 뉴스 필터링
-    # ============================================================
-    celebrity_check = check_celebrity_scandal(title, description)
+    celebrity_check = check_celebrity_scandal(title, description, text)
     if celebrity_check['should_exclude']:
-        logging.info(f"❌ [연예인 분쟁 제외] {title[:50]}... ({celebrity_check['reason']})")
-        return {
-            'is_relevant': False,
-            'relevance_score': 0,
-            'keywords': [],
-            'region': None,
-            'has_price': False,
-            'has_policy': False,
-            'reason': celebrity_check['reason']
-        }
-    
-    # ============================================================
-    # 3단계: GPT 필터링 (기존 로직)
-    # ============================================================
-    if not OPENAI_API_KEY:
-        logging.warning("⚠️ OPENAI_API_KEY not set - using keyword filtering")
-        return filter_by_keywords(title, description)
+        logging.info("❌ [연예인 분쟁 제외] %s... (%s)", title[:50], celebrity_check['reason'])
+        return _excluded_result(celebrity_check['reason'])
     
-    system_prompt = """당신은 부동산 뉴스 필터링 전문가입니다.
+    # 3단계: 키워드만으로 확실한 기사
+    return _pre_decide(title, description, text)
+
+
+_FILTER_RULES = """당신은 부동산 뉴스 필터링 전문가입니다.
 
 기사 제목과 설명을 보고 이것이 "부동산과 관련이 있는지" 판단하세요.
 
@@ -237,7 +478,9 @@ def filter_real_estate_news(title: str, description: str) -> dict:
 - 주식, 채권, 코인 등 금융상품
 - 일반 경제 뉴스 (부동산 언급 없음)
 - 정치, 사회, 문화 이슈
-- 건설사 실적이지만 부동산과 직접 연관 없음
+- 건설사 실적이지만 부동산과 직접 연관 없음"""
+
+_FILTER_SYSTEM_PROMPT = _FILTER_RULES + """
 
 JSON 형식으로 응답:
 {
@@ -250,28 +493,119 @@ JSON 형식으로 응답:
   "reason": "판단 근거 1-2줄"
 }"""
 
-    user_prompt = f"""제목: {title}
+# 기사마다 바뀌는 부분만 채워 넣는 사용자 메시지 템플릿
+_FILTER_USER_TEMPLATE = """제목: {title}
 설명: {description}
 
 이 기사가 부동산과 관련이 있습니까?"""
 
+_FILTER_BATCH_SYSTEM_PROMPT = _FILTER_RULES + """
+
+여러 기사가 JSON 배열 [{"id", "title", "description"}, ...] 로 주어집니다.
+기사마다 따로 판단하고, 모든 id에 대해 JSON 형식으로 응답:
+{
+  "results": [
+    {
+      "id": 기사 id,
+      "is_relevant": true/false,
+      "relevance_score": 0-100,
+      "keywords": ["키워드1", "키워드2", "키워드3"],
+      "region": "지역명" or null,
+      "has_price": true/false,
+      "has_policy": true/false,
+      "reason": "판단 근거 1-2줄"
+    },
+    ...
+  ]
+}"""
+
+# 한 번의 GPT 요청에 묶을 기사 수
+FILTER_BATCH_SIZE = 20
+
+
+def filter_real_estate_news(title: str, description: str) -> dict:
+    """
+    기사가 부동산과 관련이 있는지 GPT로 판단하고 핵심 지표 추출
+    
+    Returns:
+        {
+            'is_relevant': bool,
+            'relevance_score': int,
+            'keywords': list,
+            'region': str or None,
+            'has_price': bool,
+            'has_policy': bool,
+            'reason': str
+        }
+    """
+    
+    # ============================================================
+    # 1~2단계: 헤드라인 / 연예인 분쟁 제외 + 키워드 확정 판정 (GPT 없이)
+    # ============================================================
+    decided = _prefilter_news(title, description)
+    if decided:
+        return decided
+    
+    # ============================================================
+    # 3단계: GPT 필터링 (기존 로직)
+    # ============================================================
+    if not OPENAI_API_KEY:
+        logging.warning("⚠️ OPENAI_API_KEY not set - using keyword filtering")
+        return filter_by_keywords(title, description)
+    
+    cached = _cached_verdict(title, description)
+    if cached is not None:
+        _log_verdict(title, cached)
+        return cached
+    
+    return _gpt_filter_single(title, description)
+
+
+def _filter_cache_key(title: str, description: str) -> str:
+    return hashlib.sha1((title + '\x00' + description).encode('utf-8')).hexdigest()
+
+
+def _cached_verdict(title: str, description: str) -> Optional[dict]:
+    """캐시된 GPT 판정 조회"""
+    return cache_get('filter', _filter_cache_key(title, description), FILTER_CACHE_TTL)
+
+
+def _cache_verdict(title: str, description: str, result: dict):
+    """GPT 판정 저장 (키워드 폴백 결과는 저장하지 않음)"""
+    cache_set('filter', _filter_cache_key(title, description), result)
+
+
+def _filter_request_body(title: str, description: str) -> dict:
+    """기사 1개 판정용 chat completion 요청 본문"""
+    user_prompt = _FILTER_USER_TEMPLATE.format(title=title, description=description)
+
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {"role": "system", "content": _FILTER_SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ],
+        "temperature": 0.1,
+        "response_format": {"type": "json_object"}
+    }
+
+
+def _log_verdict(title: str, result: dict):
+    logging.info("%s (점수: %s) - %s...", "✅ 관련" if result['is_relevant'] else "❌ 무관",
+                 result.get('relevance_score', 0), title[:40])
+
+
+def _gpt_filter_single(title: str, description: str) -> dict:
+    """기사 1개를 GPT로 판정 (실패 시 키워드 필터링)"""
     try:
-        openai_client_filter = OpenAI(api_key=OPENAI_API_KEY)
-        response = openai_client_filter.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.1,
-            response_format={"type": "json_object"},
+        response = _openai_client.chat.completions.create(
+            **_filter_request_body(title, description),
             timeout=10
         )
         
-        result = json.loads(response.choices[0].message.content)
-        
-        status = "✅ 관련" if result['is_relevant'] else "❌ 무관"
-        logging.info(f"{status} (점수: {result['relevance_score']}) - {title[:40]}...")
+        result = orjson.loads(response.choices[0].message.content)
+        _log_verdict(title, result)
+        _cache_verdict(title, description, result)
         
         return result
         
@@ -279,74 +613,259 @@ JSON 형식으로 응답:
         logging.error(f"❌ GPT 필터링 실패: {e}")
         return filter_by_keywords(title, description)
 
-def filter_by_keywords(title: str, description: str) -> dict:
-    """키워드 기반 간단 필터링 (GPT 실패 시 폴백)"""
-    text = (title + " " + description).lower()
-    
-    real_estate_keywords = [
-        "아파트", "오피스텔", "빌딩", "상가", "토지", "주택",
-        "매매", "전세", "월세", "분양", "청약", "입주",
-        "재건축", "재개발", "정비구역", "부동산", "집값",
-        "주택가격", "전세가", "시세", "주담대", "종부세",
-        "양도세", "취득세", "국토부", "미분양"
+
+def _gpt_filter_multi(items: dict) -> dict:
+    """
+    여러 기사를 한 번의 GPT 요청으로 판정
+    
+    Args:
+        items: {id: 뉴스 아이템}
+    
+    Returns:
+        {id: 판정 결과} - 응답에 빠진 id는 포함되지 않음
+    
+    Raises:
+        GPT 호출/응답 파싱 실패 시 예외
+    """
+    payload = [
+        {
+            "id": item_id,
+            "title": item['title'],
+            "description": item['description'][:200]
+        }
+        for item_id, item in items.items()
     ]
+    user_prompt = orjson.dumps(payload).decode()
     
-    exclude_keywords = ["주식", "코인", "비트코인", "펀드", "채권"]
+    response = _openai_client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": _FILTER_BATCH_SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ],
+        temperature=0.1,
+        response_format={"type": "json_object"},
+        timeout=30
+    )
     
-    matched = sum(1 for kw in real_estate_keywords if kw in text)
-    excluded = sum(1 for kw in exclude_keywords if kw in text)
+    results = orjson.loads(response.choices[0].message.content)['results']
     
-    score = max(0, min(100, matched * 30 - excluded * 20))
-    is_relevant = score >= 30
+    results_by_id = {}
+    for result in results:
+        item_id = int(result.pop('id'))
+        if item_id in items and 'is_relevant' in result:
+            results_by_id[item_id] = result
+    
+    return results_by_id
+
+
+BATCH_POLL_INITIAL_DELAY = 5  # 첫 폴링 간격 (초, 이후 2배씩 최대 60초)
+
+def start_batch_budget():
+    """
+    지금부터 OPENAI_BATCH_MAX_WAIT초를 이번 실행의 Batch API 전체 대기 예산으로 설정
+    
+    설정 후에는 필터/요약 배치가 같은 마감 시각을 공유하므로 대기 시간이 합산되지 않음
+    """
+    global _batch_deadline
+    _batch_deadline = time.monotonic() + OPENAI_BATCH_MAX_WAIT
+
+def run_openai_batch(bodies: dict, filename: str = "batch.jsonl") -> dict:
+    """
+    OpenAI Batch API로 chat completion 요청 여러 개를 한 번에 처리 (실시간 호출보다 50% 저렴)
+    
+    마감 시각(start_batch_budget()으로 설정한 전체 예산, 없으면 지금부터
+    OPENAI_BATCH_MAX_WAIT초) 안에 배치가 끝나지 않으면 취소하고 빈 결과를 반환하므로
+    남은 요청은 호출 측에서 실시간 경로로 처리해야 합니다.
+    
+    Args:
+        bodies: {custom_id(str): chat completion 요청 본문}
+        filename: 업로드할 JSONL 파일 이름
+    
+    Returns:
+        {custom_id: 응답 message.content} - 실패/누락된 id는 포함되지 않음
+    """
+    lines = [
+        orjson.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": body
+        })
+        for custom_id, body in bodies.items()
+    ]
+    
+    deadline = _batch_deadline or time.monotonic() + OPENAI_BATCH_MAX_WAIT
+    if time.monotonic() + BATCH_POLL_INITIAL_DELAY > deadline:
+        logging.warning("⚠️ Batch API 대기 예산 소진 - 실시간 처리로 전환")
+        return {}
+    
+    try:
+        batch_file = _openai_client.files.create(
+            file=(filename, b"\n".join(lines)),
+            purpose="batch"
+        )
+        batch = _openai_client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logging.info(f"📦 Batch API 제출: {len(lines)}개 (batch_id={batch.id})")
+        
+        # 완료될 때까지 지수 백오프로 폴링
+        delay = BATCH_POLL_INITIAL_DELAY
+        while batch.status not in ('completed', 'failed', 'expired', 'cancelled'):
+            if time.monotonic() + delay > deadline:
+                logging.warning("⚠️ Batch API 대기 시간 초과 - 배치 취소")
+                _openai_client.batches.cancel(batch.id)
+                return {}
+            time.sleep(delay)
+            delay = min(delay * 2, 60)
+            batch = _openai_client.batches.retrieve(batch.id)
+        
+        if batch.status != 'completed' or not batch.output_file_id:
+            logging.error(f"❌ Batch API 실패: status={batch.status}")
+            return {}
+        
+        output = _openai_client.files.content(batch.output_file_id).text
+        
+    except Exception as e:
+        logging.error(f"❌ Batch API 호출 실패: {e}")
+        return {}
+    
+    contents = {}
+    for line in output.splitlines():
+        try:
+            record = orjson.loads(line)
+            contents[record['custom_id']] = record['response']['body']['choices'][0]['message']['content']
+        except Exception as e:
+            logging.debug("Batch 결과 파싱 실패: %s", e)
+            continue
     
-    keywords = [kw for kw in real_estate_keywords if kw in text][:5]
-    region = extract_region(text)
+    return contents
+
+
+def filter_news_batch_via_batchapi(items: dict) -> dict:
+    """
+    OpenAI Batch API로 여러 기사를 판정 (크론 크롤러용)
+    
+    Args:
+        items: {id: 뉴스 아이템}
+    
+    Returns:
+        {id: 판정 결과} - 실패/누락/시간 초과된 id는 포함되지 않음
+    """
+    contents = run_openai_batch(
+        {
+            str(item_id): _filter_request_body(item['title'], item['description'])
+            for item_id, item in items.items()
+        },
+        filename="filter_batch.jsonl"
+    )
+    
+    results_by_id = {}
+    for custom_id, content in contents.items():
+        try:
+            item_id = int(custom_id)
+            result = orjson.loads(content)
+        except Exception as e:
+            logging.debug("Batch 결과 파싱 실패: %s", e)
+            continue
+        
+        if item_id in items and 'is_relevant' in result:
+            results_by_id[item_id] = result
     
-    logging.info(f"🔑 키워드 필터 (점수: {score}) - {title[:40]}...")
+    logging.info(f"📦 Batch API 완료: {len(items)}개 중 {len(results_by_id)}개 판정")
+    return results_by_id
+
+# 키워드 확정 판정 기준 (GPT 생략)
+PRE_DECIDE_MIN_MATCHED = 3      # 부동산 키워드 N개 이상 + 제외 키워드 없음 → 관련
+PRE_DECIDE_ACCEPT_SCORE = 90
+
+def _keyword_result(text: str, hits: dict, is_relevant: bool, score: int, reason: str) -> dict:
+    """키워드 매칭 결과로 판정 결과 구성"""
+    matched_keywords = hits.get('real_estate', set())
     
     return {
         'is_relevant': is_relevant,
         'relevance_score': score,
-        'keywords': keywords,
-        'region': region,
-        'has_price': any(kw in text for kw in ['가격', '시세', '억', '만원', '상승', '하락']),
-        'has_policy': any(kw in text for kw in ['정책', '규제', '세금', '대출', '금리']),
-        'reason': f'키워드 매칭 기반 ({matched}개 매칭)'
+        'keywords': [kw for kw in REAL_ESTATE_KEYWORDS if kw in matched_keywords][:5],
+        'region': extract_region(text, hits),
+        'has_price': 'price' in hits,
+        'has_policy': 'policy' in hits,
+        'reason': reason
     }
 
-def extract_region(text: str) -> str:
-    """텍스트에서 지역 정보 추출"""
-    seoul_gu = [
-        "강남구", "강동구", "강북구", "강서구", "관악구",
-        "광진구", "구로구", "금천구", "노원구", "도봉구",
-        "동대문구", "동작구", "마포구", "서대문구", "서초구",
-        "성동구", "성북구", "송파구", "양천구", "영등포구",
-        "용산구", "은평구", "종로구", "중구", "중랑구"
-    ]
+def filter_by_keywords(title: str, description: str, text: Optional[str] = None) -> dict:
+    """키워드 기반 간단 필터링 (GPT 실패 시 폴백)"""
+    if text is None:
+        text = _prep(title, description)
+    hits = _match_keywords(text)
     
-    gyeonggi_cities = [
-        "성남시", "용인시", "수원시", "고양시", "화성시",
-        "평택시", "부천시", "안양시", "남양주시"
-    ]
+    matched = len(hits.get('real_estate', ()))
+    excluded = len(hits.get('exclude', ()))
+    
+    score = max(0, min(100, matched * 30 - excluded * 20))
+    is_relevant = score >= 30
     
-    metropolitan = ["인천", "부산", "대구", "대전", "광주", "울산", "세종"]
+    logging.info("🔑 키워드 필터 (점수: %s) - %s...", score, title[:40])
     
-    for gu in seoul_gu:
-        if gu in text:
-            return f"서울 {gu}"
+    return _keyword_result(text, hits, is_relevant, score, f'키워드 매칭 기반 ({matched}개 매칭)')
+
+def _pre_decide(title: str, description: str, text: Optional[str] = None) -> Optional[dict]:
+    """
+    키워드만으로 확실한 기사는 GPT 없이 판정
     
-    for city in gyeonggi_cities:
-        if city in text:
-            return f"경기 {city}"
+    - 부동산 키워드 3개 이상 + 제외 키워드 없음 → 관련 (90점)
+    - 부동산 키워드 없음 + 제외 키워드(주식/코인 등) 있음 → 무관 (0점)
     
-    for metro in metropolitan:
-        if metro in text:
-            return metro
+    Returns:
+        판정 결과, 애매하면 None (GPT 판단 필요)
+    """
+    if text is None:
+        text = _prep(title, description)
+    hits = _match_keywords(text)
+    
+    matched = len(hits.get('real_estate', ()))
+    excluded = len(hits.get('exclude', ()))
+    
+    if matched >= PRE_DECIDE_MIN_MATCHED and excluded == 0:
+        logging.info("⚡ [키워드 확정: 관련] (%d개 매칭) %s...", matched, title[:40])
+        return _keyword_result(text, hits, True, PRE_DECIDE_ACCEPT_SCORE, f'키워드 확정 판정 ({matched}개 매칭)')
+    
+    if matched == 0 and excluded >= 1:
+        logging.info("⚡ [키워드 확정: 무관] (제외 키워드 %d개) %s...", excluded, title[:40])
+        return _keyword_result(text, hits, False, 0, f'키워드 확정 판정 (금융상품 등 {excluded}개 매칭)')
     
     return None
 
-def filter_news_batch(news_items: list) -> list:
-    """여러 뉴스 기사를 배치로 필터링 (75점 이상만)"""
+def extract_region(text: str, hits: Optional[dict] = None) -> str:
+    """
+    텍스트에서 지역 정보 추출 (서울 구 > 경기 시 > 광역시 순으로 우선)
+    
+    Args:
+        text: 검사할 텍스트
+        hits: 이미 계산한 _match_keywords(text) 결과 (없으면 새로 계산)
+    """
+    if hits is None:
+        hits = _match_keywords(text)
+    
+    candidates = [
+        _REGION_PRIORITY[name]
+        for group in ('seoul', 'gyeonggi', 'metro')
+        for name in hits.get(group, ())
+    ]
+    
+    return min(candidates)[2] if candidates else None
+
+def filter_news_batch(news_items: list, use_batch_api: bool = False) -> list:
+    """
+    여러 뉴스 기사를 배치로 필터링 (75점 이상만)
+    
+    Args:
+        news_items: 뉴스 아이템 리스트
+        use_batch_api: True면 OpenAI Batch API로 판정 (크론 전용, 실패분은 실시간 판정)
+    """
     filtered = []
     
     # 필터링 통계
@@ -357,8 +876,49 @@ def filter_news_batch(news_items: list) -> list:
         'not_relevant': 0
     }
     
-    for item in news_items:
-        result = filter_real_estate_news(item['title'], item['description'])
+    # 사전 필터링 통과한 기사만 GPT로 판정
+    results = [_prefilter_news(item['title'], item['description']) for item in news_items]
+    pending = [idx for idx, result in enumerate(results) if result is None]
+    
+    if pending and not OPENAI_API_KEY:
+        logging.warning("⚠️ OPENAI_API_KEY not set - using keyword filtering")
+        for idx in pending:
+            results[idx] = filter_by_keywords(news_items[idx]['title'], news_items[idx]['description'])
+        pending = []
+    
+    # 이전 실행에서 판정한 기사는 캐시 재사용
+    for idx in pending:
+        cached = _cached_verdict(news_items[idx]['title'], news_items[idx]['description'])
+        if cached is not None:
+            results[idx] = cached
+            _log_verdict(news_items[idx]['title'], cached)
+    pending = [idx for idx in pending if results[idx] is None]
+    
+    if pending and use_batch_api:
+        verdicts = filter_news_batch_via_batchapi({idx: news_items[idx] for idx in pending})
+        for idx, result in verdicts.items():
+            results[idx] = result
+            _log_verdict(news_items[idx]['title'], result)
+            _cache_verdict(news_items[idx]['title'], news_items[idx]['description'], result)
+        pending = [idx for idx in pending if results[idx] is None]
+    
+    for start in range(0, len(pending), FILTER_BATCH_SIZE):
+        chunk = {idx: news_items[idx] for idx in pending[start:start + FILTER_BATCH_SIZE]}
+        try:
+            verdicts = _gpt_filter_multi(chunk)
+        except Exception as e:
+            logging.error("❌ GPT 배치 필터링 실패: %s - 개별 판정으로 전환", e)
+            verdicts = {}
+        
+        for idx, item in chunk.items():
+            if idx in verdicts:
+                results[idx] = verdicts[idx]
+                _log_verdict(item['title'], verdicts[idx])
+                _cache_verdict(item['title'], item['description'], verdicts[idx])
+            else:
+                results[idx] = _gpt_filter_single(item['title'], item['description'])
+    
+    for item, result in zip(news_items, results):
         item.update(result)
         
         # 부동산 관련 + 75점 이상만 통과
@@ -382,13 +942,13 @@ def filter_news_batch(news_items: list) -> list:
         logger.info("")
         logger.info("📊 필터링 제외 통계:")
         if filter_stats['headline'] > 0:
-            logger.info(f"   - 헤드라인 뉴스: {filter_stats['headline']}개")
+            logger.info("   - 헤드라인 뉴스: %d개", filter_stats['headline'])
         if filter_stats['celebrity_scandal'] > 0:
-            logger.info(f"   - 연예인 분쟁: {filter_stats['celebrity_scandal']}개")
+            logger.info("   - 연예인 분쟁: %d개", filter_stats['celebrity_scandal'])
         if filter_stats['low_score'] > 0:
-            logger.info(f"   - 낮은 점수 (75점 미만): {filter_stats['low_score']}개")
+            logger.info("   - 낮은 점수 (75점 미만): %d개", filter_stats['low_score'])
         if filter_stats['not_relevant'] > 0:
-            logger.info(f"   - 부동산 무관: {filter_stats['not_relevant']}개")
+            logger.info("   - 부동산 무관: %d개", filter_stats['not_relevant'])
     
     return filtered
 
@@ -396,8 +956,25 @@ def filter_news_batch(news_items: list) -> list:
 # 뉴스 검색
 # ================================================================================
 
-def search_naver_news(query: str = "부동산", display: int = 10) -> Optional[list]:
-    """네이버 뉴스 API로 최신 뉴스 검색 + 부동산 관련성 필터링"""
+_TAG_RE = re.compile(r'<[^<]+?>')
+
+def _truncate_description(description: str, limit: int = 200) -> str:
+    """요약 길이 제한 - 가능하면 limit 이내의 마지막 문장 끝(.!?)에서 자름"""
+    if len(description) <= limit:
+        return description
+    
+    tail = description[:limit]
+    cut = max(tail.rfind('.'), tail.rfind('!'), tail.rfind('?'))
+    if cut >= limit // 2:
+        return tail[:cut + 1].strip()
+    return tail.strip()
+
+async def search_naver_news(query: str = "부동산", display: int = 10, use_batch_api: bool = False) -> Optional[list]:
+    """
+    네이버 뉴스 API로 최신 뉴스 검색 + 부동산 관련성 필터링
+    
+    use_batch_api=True면 GPT 판정을 OpenAI Batch API로 처리 (크론 크롤러용)
+    """
     url = "https://openapi.naver.com/v1/search/news.json"
     
     headers = {
@@ -412,9 +989,14 @@ def search_naver_news(query: str = "부동산", display: int = 10) -> Optional[l
     }
     
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=5)
+        # 429/5xx는 지수 백오프로 재시도 (0.5초, 1초)
+        for attempt in range(SEARCH_MAX_RETRIES + 1):
+            response = await _async_http.get(url, headers=headers, params=params)
+            if response.status_code not in SEARCH_RETRY_STATUS or attempt == SEARCH_MAX_RETRIES:
+                break
+            await asyncio.sleep(0.5 * 2 ** attempt)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
         items = data.get('items', [])
         if not items:
@@ -433,22 +1015,15 @@ def search_naver_news(query: str = "부동산", display: int = 10) -> Optional[l
         processed_items = []
         for item in naver_items:
             # HTML 태그 제거
-            title = re.sub('<[^<]+?>', '', item['title'])
-            description = re.sub('<[^<]+?>', '', item['description'])
+            title = _TAG_RE.sub('', item['title'])
+            description = _TAG_RE.sub('', item['description'])
             
             # HTML 엔티티 디코딩
-            import html
             title = html.unescape(title)
             description = html.unescape(description)
             
             # 요약 길이 제한 (200자)
-            if len(description) > 200:
-                cut_pos = 200
-                for i in range(200, max(0, len(description) - 100), -1):
-                    if description[i] in '.!?':
-                        cut_pos = i + 1
-                        break
-                description = description[:cut_pos].strip()
+            description = _truncate_description(description)
             
             processed_items.append({
                 "title": title,
@@ -460,7 +1035,8 @@ def search_naver_news(query: str = "부동산", display: int = 10) -> Optional[l
         
         # 부동산 관련성 필터링 (75점 이상만)
         logger.info(f"🔍 필터링 시작: {len(processed_items)}개 기사")
-        filtered_items = filter_news_batch(processed_items)
+        # GPT 판정은 동기 호출이므로 이벤트 루프 밖에서 처리
+        filtered_items = await asyncio.to_thread(filter_news_batch, processed_items, use_batch_api)
         logger.info(
             f"✅ 필터링 완료: {len(processed_items)}개 중 {len(filtered_items)}개 선정 (75점 이상) "
             f"({len(filtered_items)/len(processed_items)*100:.1f}%)"
@@ -471,42 +1047,49 @@ def search_naver_news(query: str = "부동산", display: int = 10) -> Optional[l
         logger.error(f"❌ 뉴스 검색 오류: {e}")
         return None
 
+CRAWL_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
+    'Referer': 'https://news.naver.com/'
+}
+
+def _parse_article(html_text: str, url: str) -> str:
+    """기사 HTML에서 본문 추출"""
+    tree = LexborHTMLParser(html_text)
+    
+    # 네이버 뉴스 본문 추출
+    if 'news.naver.com' in url:
+        article = tree.css_first('#dic_area') or tree.css_first('#articeBody') or tree.css_first('.news_end')
+        if article:
+            for tag in article.css('script, style, aside'):
+                tag.decompose()
+            # 빈 텍스트 노드는 건너뜀
+            text = article.text(separator='\n', strip=True)
+            content = '\n'.join(line for line in text.split('\n') if line)
+            logger.info(f"📄 크롤링 성공: {len(content)}자")
+            return content
+    
+    # 일반 뉴스 사이트
+    paragraphs = (p.text(strip=True) for p in tree.css('p'))
+    content = '\n'.join([text for text in paragraphs if len(text) > 50])
+    
+    if content:
+        logger.info(f"📄 크롤링 성공: {len(content)}자")
+        return content
+    else:
+        return "본문을 추출할 수 없습니다."
+
 def crawl_news_content(url: str) -> str:
     """뉴스 URL에서 본문 추출 (재시도 포함)"""
     max_retries = 2
     
     for attempt in range(max_retries):
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
-                'Referer': 'https://news.naver.com/'
-            }
-            response = requests.get(url, headers=headers, timeout=15)
+            response = _http.get(url, headers=CRAWL_HEADERS, timeout=15)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'lxml')
-            
-            # 네이버 뉴스 본문 추출
-            if 'news.naver.com' in url:
-                article = soup.select_one('#dic_area') or soup.select_one('#articeBody') or soup.select_one('.news_end')
-                if article:
-                    for tag in article.find_all(['script', 'style', 'aside']):
-                        tag.decompose()
-                    content = article.get_text(strip=True, separator='\n')
-                    logger.info(f"📄 크롤링 성공: {len(content)}자")
-                    return content
-            
-            # 일반 뉴스 사이트
-            paragraphs = soup.find_all('p')
-            content = '\n'.join([p.get_text(strip=True) for p in paragraphs if len(p.get_text(strip=True)) > 50])
-            
-            if content:
-                logger.info(f"📄 크롤링 성공: {len(content)}자")
-                return content
-            else:
-                return "본문을 추출할 수 없습니다."
+            return _parse_article(response.text, url)
             
         except requests.exceptions.Timeout:
             if attempt < max_retries - 1:
@@ -556,7 +1139,7 @@ def init_google_sheets():
     try:
         logger.info("🔄 Initializing Google Sheets...")
         
-        creds_dict = json.loads(GOOGLE_SHEETS_CREDENTIALS)
+        creds_dict = orjson.loads(GOOGLE_SHEETS_CREDENTIALS)
         scopes = [
             'https://www.googleapis.com/auth/spreadsheets',
             'https://www.googleapis.com/auth/drive'
@@ -571,18 +1154,10 @@ def init_google_sheets():
         try:
             headers = gsheet_worksheet.row_values(1)
             if not headers or headers[0] != 'timestamp':
-                gsheet_worksheet.insert_row([
-                    'timestamp', 'title', 'description', 'url',
-                    'is_relevant', 'relevance_score', 'keywords', 'region',
-                    'has_price', 'has_policy', 'reason', 'user_id'
-                ], 1)
+                gsheet_worksheet.insert_row(NEWS_COLUMNS, 1)
                 logger.info("✅ Google Sheets headers created")
         except:
-            gsheet_worksheet.insert_row([
-                'timestamp', 'title', 'description', 'url',
-                'is_relevant', 'relevance_score', 'keywords', 'region',
-                'has_price', 'has_policy', 'reason', 'user_id'
-            ], 1)
+            gsheet_worksheet.insert_row(NEWS_COLUMNS, 1)
         
         logger.info(f"✅ Google Sheets initialized")
         return True
@@ -591,6 +1166,73 @@ def init_google_sheets():
         logger.error(f"❌ Failed to initialize Google Sheets: {e}")
         return False
 
+# 최근 기록 조회 시 한 번에 읽을 행 수
+RECENT_SCAN_CHUNK = 500
+
+def _parse_record_time(timestamp_str: str) -> datetime:
+    """시트의 timestamp 문자열 → timezone-aware datetime"""
+    # ISO format 파싱 (timezone-aware로 변환)
+    # 'Z'가 있으면 UTC, 없으면 UTC로 간주
+    if timestamp_str.endswith('Z'):
+        return datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+    elif '+' in timestamp_str or timestamp_str.count('-') > 2:
+        # 이미 timezone 정보가 있음
+        return datetime.fromisoformat(timestamp_str)
+    else:
+        # timezone 정보가 없으면 UTC로 간주
+        return datetime.fromisoformat(timestamp_str).replace(tzinfo=timezone.utc)
+
+def _get_recent_rows(hours: int) -> tuple:
+    """
+    구글 시트 끝에서부터 거꾸로 읽어 최근 N시간 내 행만 가져오기
+    
+    시트는 시간순으로 추가되므로 전체를 받지 않고 RECENT_SCAN_CHUNK 행씩
+    끝부분만 읽다가 N시간보다 오래된 행을 만나면 중단
+    
+    Returns:
+        (최근 행 리스트 [timestamp, title, description, url], 확인한 레코드 수)
+    """
+    cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+    
+    row_count = len(gsheet_worksheet.col_values(1))
+    
+    recent_rows = []
+    checked_count = 0
+    end_row = row_count
+    
+    while end_row >= 2:
+        start_row = max(2, end_row - RECENT_SCAN_CHUNK + 1)
+        values = gsheet_worksheet.get(f'A{start_row}:D{end_row}')
+        
+        for row in reversed(values):
+            if not row or not row[0]:
+                continue
+            
+            try:
+                record_time = _parse_record_time(row[0])
+            except Exception as e:
+                # 개별 레코드 파싱 실패는 로그만 남기고 계속
+                logger.debug(f"레코드 파싱 실패: {e}")
+                continue
+            
+            checked_count += 1
+            
+            if record_time < cutoff_time:
+                return recent_rows, checked_count
+            
+            recent_rows.append(row)
+        
+        end_row = start_row - 1
+    
+    return recent_rows, checked_count
+
+def _urls_from_rows(rows: list) -> set:
+    return {row[3] for row in rows if len(row) > 3 and row[3]}
+
+def _titles_from_rows(rows: list) -> set:
+    # 제목을 정규화 (소문자, 공백 제거)
+    return {row[1].lower().strip().replace(' ', '') for row in rows if len(row) > 1 and row[1]}
+
 def get_recent_urls_from_gsheet(hours: int = 3) -> set:
     """
     구글 시트에서 최근 N시간 내 저장된 URL 목록 가져오기
@@ -608,54 +1250,15 @@ def get_recent_urls_from_gsheet(hours: int = 3) -> set:
         return set()
     
     try:
-        from datetime import datetime, timedelta, timezone
+        recent_rows, checked_count = _get_recent_rows(hours)
         
-        # 현재 UTC 시간
-        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
-        
-        # 전체 레코드 가져오기
-        all_records = gsheet_worksheet.get_all_records()
-        
-        recent_urls = set()
-        checked_count = 0
-        
-        for record in all_records:
-            try:
-                # timestamp 파싱 (ISO format)
-                timestamp_str = record.get('timestamp', '')
-                if not timestamp_str:
-                    continue
-                
-                # ISO format 파싱 (timezone-aware로 변환)
-                # 'Z'가 있으면 UTC, 없으면 UTC로 간주
-                if timestamp_str.endswith('Z'):
-                    record_time = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                elif '+' in timestamp_str or timestamp_str.count('-') > 2:
-                    # 이미 timezone 정보가 있음
-                    record_time = datetime.fromisoformat(timestamp_str)
-                else:
-                    # timezone 정보가 없으면 UTC로 간주
-                    record_time = datetime.fromisoformat(timestamp_str).replace(tzinfo=timezone.utc)
-                
-                checked_count += 1
-                
-                # 최근 N시간 이내면 URL 추가
-                if record_time >= cutoff_time:
-                    url = record.get('url', '')
-                    if url:
-                        recent_urls.add(url)
-                        
-            except Exception as e:
-                # 개별 레코드 파싱 실패는 로그만 남기고 계속
-                logger.debug(f"레코드 파싱 실패: {e}")
-                continue
+        recent_urls = _urls_from_rows(recent_rows)
         
         logger.info(f"📋 최근 {hours}시간 URL 확인: 전체 {checked_count}개 레코드 중 {len(recent_urls)}개 URL")
         return recent_urls
         
     except Exception as e:
         logger.error(f"❌ 최근 URL 조회 실패: {e}")
-        import traceback
         logger.error(traceback.format_exc())
         return set()
 
@@ -676,136 +1279,141 @@ def get_recent_titles_from_gsheet(hours: int = 24) -> set:
         return set()
     
     try:
-        from datetime import datetime, timedelta, timezone
-        
-        # 현재 UTC 시간
-        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+        recent_rows, checked_count = _get_recent_rows(hours)
         
-        # 전체 레코드 가져오기
-        all_records = gsheet_worksheet.get_all_records()
-        
-        recent_titles = set()
-        checked_count = 0
-        
-        for record in all_records:
-            try:
-                # timestamp 파싱
-                timestamp_str = record.get('timestamp', '')
-                if not timestamp_str:
-                    continue
-                
-                # ISO format 파싱 (timezone-aware로 변환)
-                if timestamp_str.endswith('Z'):
-                    record_time = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                elif '+' in timestamp_str or timestamp_str.count('-') > 2:
-                    record_time = datetime.fromisoformat(timestamp_str)
-                else:
-                    record_time = datetime.fromisoformat(timestamp_str).replace(tzinfo=timezone.utc)
-                
-                checked_count += 1
-                
-                # 최근 N시간 이내면 제목 추가
-                if record_time >= cutoff_time:
-                    title = record.get('title', '')
-                    if title:
-                        # 제목을 정규화 (소문자, 공백 제거, 특수문자 제거)
-                        normalized_title = title.lower().strip().replace(' ', '')
-                        recent_titles.add(normalized_title)
-                        
-            except Exception as e:
-                logger.debug(f"레코드 파싱 실패: {e}")
-                continue
+        recent_titles = _titles_from_rows(recent_rows)
         
         logger.info(f"📋 최근 {hours}시간 제목 확인: 전체 {checked_count}개 레코드 중 {len(recent_titles)}개 제목")
         return recent_titles
         
     except Exception as e:
         logger.error(f"❌ 최근 제목 조회 실패: {e}")
-        import traceback
         logger.error(traceback.format_exc())
         return set()
 
+# 최근 URL 인덱스 기본 범위 (시간)
+RECENT_URL_HOURS = 24
+
+def load_recent_url_index(hours: int = RECENT_URL_HOURS) -> set:
+    """
+    구글 시트에서 최근 N시간 URL을 한 번 읽어 프로세스 내 인덱스 구성
+    
+    이후 중복 확인은 is_url_recent()로 시트 조회 없이 처리
+    """
+    global _recent_url_index
+    _recent_url_index = get_recent_urls_from_gsheet(hours=hours)
+    return _recent_url_index
+
+def load_recent_index(hours: int = RECENT_URL_HOURS) -> set:
+    """
+    최근 N시간 행을 시트에서 한 번만 읽어 URL 인덱스와 제목 집합을 함께 구성
+    
+    URL은 is_url_recent()용 인덱스로 저장하고, 제목 집합(정규화)은 반환
+    """
+    global _recent_url_index
+    
+    if not gsheet_worksheet:
+        logger.warning("⚠️ Google Sheets not initialized - 중복 체크 불가")
+        _recent_url_index = set()
+        return set()
+    
+    try:
+        recent_rows, checked_count = _get_recent_rows(hours)
+    except Exception as e:
+        logger.error(f"❌ 최근 기록 조회 실패: {e}")
+        logger.error(traceback.format_exc())
+        _recent_url_index = set()
+        return set()
+    
+    _recent_url_index = _urls_from_rows(recent_rows)
+    recent_titles = _titles_from_rows(recent_rows)
+    
+    logger.info("📋 최근 %d시간 확인: 전체 %d개 레코드 중 URL %d개, 제목 %d개",
+                hours, checked_count, len(_recent_url_index), len(recent_titles))
+    return recent_titles
+
+def is_url_recent(url: str) -> bool:
+    """최근 저장된 URL인지 확인 (인덱스가 없으면 먼저 로드)"""
+    if _recent_url_index is None:
+        load_recent_url_index()
+    return url in _recent_url_index
+
 def init_csv_file():
     """Initialize CSV file with headers"""
     try:
         if not os.path.exists(CSV_FILE_PATH):
             with open(CSV_FILE_PATH, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
-                writer.writerow([
-                    'timestamp', 'title', 'description', 'url',
-                    'is_relevant', 'relevance_score', 'keywords', 'region',
-                    'has_price', 'has_policy', 'reason', 'user_id'
-                ])
+                writer.writerow(NEWS_COLUMNS)
             logger.info(f"✅ CSV file created: {CSV_FILE_PATH}")
         return True
     except Exception as e:
         logger.error(f"❌ Failed to initialize CSV: {e}")
         return False
 
-def save_news_to_csv(news_data: dict):
-    """Save news to CSV file"""
+def _news_to_row(news_data: dict) -> list:
+    """뉴스 dict → NEWS_COLUMNS 순서의 행"""
+    return [
+        news_data['timestamp'],
+        news_data['title'],
+        news_data['description'],
+        news_data['url'],
+        news_data.get('is_relevant', True),
+        news_data.get('relevance_score', 0),
+        ', '.join(news_data.get('keywords', [])),
+        news_data.get('region', ''),
+        news_data.get('has_price', False),
+        news_data.get('has_policy', False),
+        news_data.get('reason', ''),
+        news_data['user_id']
+    ]
+
+def save_news_batch_to_csv(rows: list):
+    """Save news to CSV file (한 번 열어서 버퍼링 후 전체 기록)"""
     try:
-        with open(CSV_FILE_PATH, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                news_data['timestamp'],
-                news_data['title'],
-                news_data['description'],
-                news_data['url'],
-                news_data.get('is_relevant', True),
-                news_data.get('relevance_score', 0),
-                ', '.join(news_data.get('keywords', [])),
-                news_data.get('region', ''),
-                news_data.get('has_price', False),
-                news_data.get('has_policy', False),
-                news_data.get('reason', ''),
-                news_data['user_id']
-            ])
+        with open(CSV_FILE_PATH, 'a', newline='', encoding='utf-8', buffering=65536) as f:
+            writer = csv.DictWriter(f, fieldnames=NEWS_COLUMNS)
+            writer.writerows(dict(zip(NEWS_COLUMNS, _news_to_row(news_data))) for news_data in rows)
         return True
     except Exception as e:
         logger.error(f"❌ Failed to save to CSV: {e}")
         return False
 
-def save_news_to_gsheet(news_data: dict):
-    """Save news to Google Sheets"""
+def save_news_to_gsheet(news_list: list):
+    """Save news to Google Sheets (API 호출 1회로 전체 추가)"""
     if not gsheet_worksheet:
         logger.warning("⚠️ Google Sheets not initialized - skipping")
         return False
     
     try:
-        gsheet_worksheet.append_row([
-            news_data['timestamp'],
-            news_data['title'],
-            news_data['description'],
-            news_data['url'],
-            news_data.get('is_relevant', True),
-            news_data.get('relevance_score', 0),
-            ', '.join(news_data.get('keywords', [])),
-            news_data.get('region', ''),
-            news_data.get('has_price', False),
-            news_data.get('has_policy', False),
-            news_data.get('reason', ''),
-            news_data['user_id']
-        ])
+        rows = [_news_to_row(news_data) for news_data in news_list]
+        gsheet_worksheet.append_rows(
+            rows,
+            value_input_option='RAW',
+            insert_data_option='INSERT_ROWS'
+        )
         return True
     except Exception as e:
         logger.error(f"❌ Failed to save to Google Sheets: {e}")
         return False
 
-async def save_all_news_background(news_items: list, user_id: str):
-    """백그라운드에서 모든 뉴스 저장 (크롤링 없이 메타데이터만)"""
-    logger.info(f"🔄 백그라운드 저장 시작: {len(news_items)}개 (크롤링 제외)")
-    saved_count = 0
+def save_all_news_sync(news_items: list, user_id: str):
+    """모든 뉴스 저장 (크롤링 없이 메타데이터만) - gspread/CSV 쓰기라 블로킹"""
+    logger.info("🔄 백그라운드 저장 시작: %d개 (크롤링 제외)", len(news_items))
+    to_save = []
     
     for idx, news_item in enumerate(news_items):
         try:
-            if idx > 0:
-                await asyncio.sleep(0.5)
-            
             # 키 이름 통일 (link → url)
             if 'link' in news_item and 'url' not in news_item:
                 news_item['url'] = news_item['link']
             
+            # 최근에 이미 저장된 URL은 건너뜀
+            if is_url_recent(news_item['url']):
+                logger.info("⚠️ 이미 저장된 URL - 건너뜀: %s...", news_item['title'][:30])
+                continue
+            _recent_url_index.add(news_item['url'])
+            
             news_item['user_id'] = user_id
             
             # 필터링 메타데이터 기본값
@@ -818,19 +1426,26 @@ async def save_all_news_background(news_items: list, user_id: str):
                 news_item['has_policy'] = False
                 news_item['reason'] = 'Filtering module not available'
             
-            # 저장
-            save_news_to_csv(news_item)
-            save_news_to_gsheet(news_item)
-            
-            saved_count += 1
-            logger.info(
-                f"✅ [{saved_count}/{len(news_items)}] 저장 완료 "
-                f"[{news_item.get('relevance_score', 0)}점] "
-                f"{news_item['title'][:30]}..."
-            )
+            # 행 변환이 가능한지 미리 확인 (실패한 뉴스만 제외)
+            _news_to_row(news_item)
+            to_save.append(news_item)
             
         except Exception as e:
-            logger.error(f"❌ 뉴스 {idx+1} 저장 실패: {e}")
+            logger.error("❌ 뉴스 %d 저장 실패: %s", idx + 1, e)
             continue
     
-    logger.info(f"🎉 백그라운드 저장 완료: {saved_count}개")
+    # 저장 (CSV / Google Sheets 각각 한 번씩)
+    if to_save:
+        save_news_batch_to_csv(to_save)
+        save_news_to_gsheet(to_save)
+    
+    if logger.isEnabledFor(logging.INFO):
+        for saved_count, news_item in enumerate(to_save, 1):
+            logger.info("✅ [%d/%d] 저장 완료 [%s점] %s...", saved_count, len(news_items),
+                        news_item.get('relevance_score', 0), news_item['title'][:30])
+    
+    logger.info("🎉 백그라운드 저장 완료: %d개", len(to_save))
+
+async def save_all_news_background(news_items: list, user_id: str):
+    """백그라운드에서 모든 뉴스 저장 (블로킹 저장은 스레드에서 실행해 이벤트 루프를 막지 않음)"""
+    await asyncio.to_thread(save_all_news_sync, news_items, user_id)
@@ -8,10 +8,16 @@ import asyncio
 import logging
 import sys
 import os
-import json
+import re
+import hashlib
+import time
+import traceback
 from datetime import datetime
-from openai import OpenAI
-from difflib import SequenceMatcher
+from itertools import islice
+from openai import AsyncOpenAI
+import numpy as np
+from rapidfuzz import fuzz, process
+from datasketch import MinHash, MinHashLSH
 
 # 공통 함수 임포트
 from common import (
@@ -19,8 +25,13 @@ from common import (
     save_all_news_background,
     init_google_sheets,
     init_csv_file,
-    get_recent_urls_from_gsheet,
-    get_recent_titles_from_gsheet
+    load_recent_index,
+    is_url_recent,
+    run_openai_batch,
+    start_batch_budget,
+    cache_get,
+    cache_set,
+    OPENAI_USE_BATCH_API
 )
 
 # ================================================================================
@@ -33,6 +44,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 요약 요청마다 새로 만들지 않고 재사용 (keep-alive로 TLS 핸드셰이크 절약)
+_HAS_OPENAI = bool(os.getenv("OPENAI_API_KEY"))
+_OPENAI_CLIENT = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY")) if _HAS_OPENAI else None
+
 # ================================================================================
 # 크롤링 통계
 # ================================================================================
@@ -43,13 +58,23 @@ class CrawlStats:
         self.total_fetched = 0
         self.total_filtered = 0
         self.total_saved = 0
-        self.start_time = None
+        self.start_time = None  # 로그 표시용 시각
         self.end_time = None
+        self._t0 = None  # 소요시간 측정용 (단조 시계)
+        self._elapsed = None
+    
+    def start(self):
+        self.start_time = datetime.now()
+        self._t0 = time.perf_counter()
+    
+    def stop(self):
+        self.end_time = datetime.now()
+        self._elapsed = time.perf_counter() - self._t0
     
     def print_summary(self):
         """통계 요약 출력"""
-        if self.start_time and self.end_time:
-            elapsed = (self.end_time - self.start_time).total_seconds()
+        if self._elapsed is not None:
+            elapsed = self._elapsed
             logger.info("=" * 70)
             logger.info("📊 크롤링 통계 요약")
             logger.info(f"   ⏱️  소요시간: {elapsed:.1f}초")
@@ -62,107 +87,274 @@ class CrawlStats:
             logger.info("=" * 70)
 
 # ================================================================================
-# 뉴스 요약 함수 (크롤러 전용)
+# 근사 중복 제목 인덱스
 # ================================================================================
 
-def generate_news_summary(title: str, description: str) -> str:
+def normalize_title(title: str) -> str:
+    """제목 비교용 정규화 (소문자, 공백 제거) - 기사마다 한 번만 계산해서 '_norm_title'에 저장"""
+    return title.lower().replace(' ', '').strip()
+
+def _title_shingles(text: str) -> set:
+    """정규화된 제목의 글자 3-gram (MinHash 입력용 bytes)"""
+    return {text[i:i + 3].encode('utf-8') for i in range(max(1, len(text) - 2))}
+
+class TitleIndex:
     """
-    GPT를 사용해서 뉴스를 3-4문장으로 요약 (크롤러 전용)
-    
-    Args:
-        title: 뉴스 제목
-        description: 네이버 API에서 받은 description
+    최근 저장된 제목의 MinHash LSH 인덱스 (근사 중복 체크용)
     
-    Returns:
-        3-4문장의 충실한 요약 (200-250자)
+    크론 실행마다 파일시스템이 새로 시작되므로 파일로 유지하지 않고,
+    시트에서 읽은 최근 24시간 제목으로 매번 구성
     """
+    def __init__(self, norm_titles=(), threshold: float = 0.85, num_perm: int = 64):
+        self.num_perm = num_perm
+        self.lsh = MinHashLSH(threshold=threshold, num_perm=num_perm)
+        
+        titles = [title for title in set(norm_titles) if title]
+        minhashes = MinHash.bulk([list(_title_shingles(title)) for title in titles], num_perm=num_perm)
+        for title, minhash in zip(titles, minhashes):
+            self.lsh.insert(title, minhash)
     
-    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+    def _minhash(self, text: str) -> MinHash:
+        minhash = MinHash(num_perm=self.num_perm)
+        for shingle in _title_shingles(text):
+            minhash.update(shingle)
+        return minhash
     
-    if not OPENAI_API_KEY:
-        # GPT 사용 불가 시 문장 단위로 자르기
-        if len(description) > 250:
-            sentences = description.split('.')
-            if len(sentences) >= 3:
-                return sentences[0] + '.' + sentences[1] + '.' + sentences[2] + '.'
-            else:
-                return description[:250].strip() + '...'
-        return description
+    def is_near_duplicate(self, norm_title: str) -> bool:
+        """이미 저장된 제목과 거의 같은지 확인 (normalize_title 결과를 받음)"""
+        return bool(self.lsh.query(self._minhash(norm_title)))
+
+# ================================================================================
+# 뉴스 요약 함수 (크롤러 전용)
+# ================================================================================
+
+_SENTENCE_RE = re.compile(r'[^.]+\.')
+# 실제 문장 끝만 (말줄임표 '...'와 '3.3㎡', '0.5%' 같은 소수점은 제외)
+_SENTENCE_END_RE = re.compile(r'(?<!\.)[.!?]["\'”’]?(?=\s|$)')
+
+def _truncate_to_n_sentences(text: str, n: int = 3, maxlen: int = 250) -> str:
+    """maxlen보다 길면 앞의 n문장만 남기기 (문장이 부족하면 글자 수로 자름)"""
+    if len(text) <= maxlen:
+        return text
+    
+    # 앞 n문장만 찾으면 멈춤
+    sentences = [m.group() for m in islice(_SENTENCE_RE.finditer(text), n)]
+    if len(sentences) >= n:
+        return ''.join(sentences)
+    return text[:maxlen].strip() + '...'
+
+def _fallback_summary(description: str) -> str:
+    """GPT 사용 불가/실패 시 문장 단위로 자르기"""
+    return _truncate_to_n_sentences(description)
+
+SUMMARY_MODEL = "gpt-4o-mini"
+SUMMARY_CACHE_TTL = 7 * 24 * 60 * 60  # 요약 캐시 유효기간 (초) - common의 sqlite 캐시라 작업 디렉터리가 유지될 때만 효과
+SUMMARY_PROMPT_VERSION = 3  # 프롬프트/길이 기준을 바꾸면 올릴 것 (이전 캐시 무효화)
+SUMMARY_MAX_CHARS = 120  # 요약 목표 길이 - 프롬프트와 원문 그대로 사용 기준이 함께 씀
+SUMMARY_MAX_TOKENS = 160  # 한글 120자 + 여유 (문장 중간에 잘리지 않도록)
+
+# 예시 답변은 입력(제목/설명)에 있는 사실만 사용 - 없는 내용을 지어내도록 학습시키지 않기 위함
+_SUMMARY_SYSTEM_PROMPT = f"""당신은 뉴스 요약 전문가입니다.
+뉴스 제목과 설명을 2문장, 최대 {SUMMARY_MAX_CHARS}자의 자연스러운 한국어로 요약하세요.
+- 수치, 날짜, 지역, 주체 등 구체적인 정보를 반드시 포함
+- 누가, 무엇을, 왜, 어떻게 + 간단한 맥락/배경
+- 요약문만 출력 (따옴표, 머리말 없이)"""
+
+_SUMMARY_USER_TEMPLATE = """제목: {title}
+설명: {description}"""
+
+_SUMMARY_EXAMPLE = [
+    {
+        "role": "user",
+        "content": _SUMMARY_USER_TEMPLATE.format(
+            title="서울 강남구 재건축 아파트 가격 급등...규제 완화 영향",
+            description="정부의 재건축 규제 완화 발표 이후 강남구 재건축 아파트 가격이 전월 대비 5% 올랐다. "
+                        "대치동과 압구정동 단지가 상승을 이끌었고, 전문가들은 강세가 당분간 이어질 것으로 내다봤다."
+        )
+    },
+    {
+        "role": "assistant",
+        "content": "서울 강남구 재건축 아파트 가격이 규제 완화 발표 이후 전월 대비 5% 상승했다. "
+                   "대치동·압구정동 단지가 상승세를 이끌었으며 전문가들은 강세가 당분간 이어질 것으로 본다."
+    },
+]
+
+def _summary_request_body(title: str, description: str) -> dict:
+    """뉴스 요약용 chat completion 요청 본문"""
+    user_prompt = _SUMMARY_USER_TEMPLATE.format(title=title, description=description)
+
+    return {
+        "model": SUMMARY_MODEL,
+        "messages": [
+            {"role": "system", "content": _SUMMARY_SYSTEM_PROMPT},
+            *_SUMMARY_EXAMPLE,
+            {"role": "user", "content": user_prompt}
+        ],
+        "temperature": 0,
+        "max_tokens": SUMMARY_MAX_TOKENS
+    }
+
+def _parse_summary(content: str, description: str) -> str:
+    """GPT 응답 → 요약문"""
+    summary = (content or '').strip().strip('"')
+    if not summary:
+        summary = description[:250]
+    
+    # 요약이 너무 길면 자르기
+    if len(summary) > 280:
+        summary = summary[:277] + '...'
     
-    system_prompt = """당신은 뉴스 요약 전문가입니다.
-주어진 뉴스 제목과 설명을 읽고, 핵심 내용을 3-4문장으로 충실하게 요약하세요.
+    return summary
 
-요약 규칙:
-- 3-4문장으로 작성 (200-250자)
-- 구체적인 정보를 반드시 포함 (수치, 날짜, 지역, 주체 등)
-- 단순히 "~했다"가 아니라 "누가, 무엇을, 왜, 어떻게"를 포함
-- 뉴스의 맥락과 배경까지 간략히 설명
-- 자연스러운 한국어 문장
+def _summary_cache_key(title: str, description: str) -> str:
+    key = f"{SUMMARY_MODEL}|v{SUMMARY_PROMPT_VERSION}|{title}|{description}"
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
 
-예시:
-입력: "서울 강남구 재건축 아파트 가격 급등...규제 완화 영향"
-출력: "서울 강남구 재건축 아파트 가격이 전월 대비 5% 상승했다. 정부의 재건축 규제 완화와 금리 인하 기대감이 주요 원인으로 작용했다. 특히 대치동과 압구정동 일대 단지들이 강세를 보였다. 전문가들은 이러한 상승세가 당분간 지속될 것으로 전망했다."
+def _cached_summary(title: str, description: str):
+    """이전 실행에서 만든 요약 조회 (없으면 None)"""
+    return cache_get('summary', _summary_cache_key(title, description), SUMMARY_CACHE_TTL)
 
-JSON 형식으로 응답:
-{"summary": "요약 내용"}"""
+def _cache_summary(title: str, description: str, summary: str):
+    """GPT 요약 저장 (폴백 요약은 저장하지 않음)"""
+    cache_set('summary', _summary_cache_key(title, description), summary)
 
-    user_prompt = f"""제목: {title}
-설명: {description}
+def _is_short_enough(description: str) -> bool:
+    """GPT 요약 없이 원문을 그대로 써도 되는지 (요약 목표 길이 이하이고 2문장 이상)"""
+    return len(description) <= SUMMARY_MAX_CHARS and len(_SENTENCE_END_RE.findall(description)) >= 2
 
-위 뉴스를 3-4문장으로 충실하게 요약하세요. 구체적인 정보(수치, 지역, 날짜 등)를 반드시 포함하세요."""
+async def _summarize_truncate(title: str, description: str) -> str:
+    """API 키가 없을 때의 요약 - 원문을 문장 단위로 자르기만 함"""
+    if _is_short_enough(description):
+        return description
+    return _fallback_summary(description)
 
+async def _summarize_gpt(title: str, description: str) -> str:
+    """
+    GPT를 사용해서 뉴스를 2문장으로 요약 (크롤러 전용)
+    
+    Args:
+        title: 뉴스 제목
+        description: 네이버 API에서 받은 description
+    
+    Returns:
+        2문장, 최대 120자 요약
+    """
+    if _is_short_enough(description):
+        return description
+    
+    cached = _cached_summary(title, description)
+    if cached is not None:
+        return cached
+    
     try:
-        openai_client = OpenAI(api_key=OPENAI_API_KEY)
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.3,
-            response_format={"type": "json_object"},
+        response = await _OPENAI_CLIENT.chat.completions.create(
+            **_summary_request_body(title, description),
             timeout=15
         )
         
-        result = json.loads(response.choices[0].message.content)
-        summary = result.get('summary', description[:250])
-        
-        # 요약이 너무 길면 자르기
-        if len(summary) > 280:
-            summary = summary[:277] + '...'
-        
+        summary = _parse_summary(response.choices[0].message.content, description)
+        _cache_summary(title, description, summary)
         return summary
         
     except Exception as e:
         logger.warning(f"⚠️ GPT 요약 실패: {e} - 원본 사용")
-        # 실패 시 문장 단위로 자르기
-        if len(description) > 250:
-            sentences = description.split('.')
-            if len(sentences) >= 3:
-                return sentences[0] + '.' + sentences[1] + '.' + sentences[2] + '.'
-            else:
-                return description[:250].strip() + '...'
-        return description
+        return _fallback_summary(description)
 
-def calculate_title_similarity(title1: str, title2: str) -> float:
+# API 키 유무는 실행 중 바뀌지 않으므로 import 시점에 구현을 고름
+generate_news_summary = _summarize_gpt if _HAS_OPENAI else _summarize_truncate
+
+async def generate_news_summaries_batch(news_items: list, max_concurrency: int = 8) -> list:
     """
-    두 제목 간의 유사도 계산 (0.0 ~ 1.0)
+    여러 뉴스 요약을 한 번에 생성
     
-    Args:
-        title1: 첫 번째 제목
-        title2: 두 번째 제목
+    OPENAI_USE_BATCH_API면 Batch API로 일괄 처리하고, 나머지(또는 기본)는
+    최대 max_concurrency개씩 동시에 요청
     
     Returns:
-        유사도 (0.0 = 완전 다름, 1.0 = 완전 같음)
+        news_items와 같은 순서의 요약 리스트
     """
-    # 소문자 변환 및 공백 정리
-    t1 = title1.lower().strip()
-    t2 = title2.lower().strip()
+    summaries = [None] * len(news_items)
+    
+    for idx, item in enumerate(news_items):
+        if _is_short_enough(item['description']):
+            summaries[idx] = item['description']
+        elif _HAS_OPENAI:
+            summaries[idx] = _cached_summary(item['title'], item['description'])
+    
+    pending = [idx for idx, summary in enumerate(summaries) if summary is None]
+    
+    if OPENAI_USE_BATCH_API and _HAS_OPENAI and pending:
+        contents = await asyncio.to_thread(
+            run_openai_batch,
+            {
+                str(idx): _summary_request_body(news_items[idx]['title'], news_items[idx]['description'])
+                for idx in pending
+            },
+            "summary_batch.jsonl"
+        )
+        for custom_id, content in contents.items():
+            idx = int(custom_id)
+            item = news_items[idx]
+            try:
+                summaries[idx] = _parse_summary(content, item['description'])
+                _cache_summary(item['title'], item['description'], summaries[idx])
+            except Exception as e:
+                logger.debug(f"Batch 요약 파싱 실패: {e}")
+    
+    sem = asyncio.Semaphore(max_concurrency)
+    
+    async def summarize(idx: int, item: dict):
+        if summaries[idx] is not None:
+            return
+        async with sem:
+            summaries[idx] = await generate_news_summary(item['title'], item['description'])
+    
+    results = await asyncio.gather(
+        *(summarize(idx, item) for idx, item in enumerate(news_items)),
+        return_exceptions=True
+    )
     
-    # SequenceMatcher로 유사도 계산
-    similarity = SequenceMatcher(None, t1, t2).ratio()
+    for idx, result in enumerate(results):
+        if isinstance(result, Exception) or summaries[idx] is None:
+            summaries[idx] = _fallback_summary(news_items[idx]['description'])
     
-    return similarity
+    return summaries
+
+def _dedup_mask(titles: list, similarity_threshold: float):
+    """
+    점수 순으로 정렬된 제목에서 유지할 항목 마스크 계산
+    
+    Returns:
+        (kept 마스크, [(중복 인덱스, 유지된 인덱스, 유사도), ...])
+    """
+    # 전체 N×N 유사도 행렬을 한 번에 계산 (C 구현)
+    # score_cutoff 미만은 0으로 처리 (길이 차이가 큰 쌍은 내부에서 바로 건너뜀)
+    sim = process.cdist(
+        titles, titles,
+        scorer=fuzz.ratio,
+        score_cutoff=similarity_threshold * 100,
+        workers=-1
+    ) / 100.0
+    
+    # 점수 순으로 살아남은 기사마다 그보다 뒤(점수 낮은)의 유사 기사를 한 번에 제외
+    n = len(titles)
+    kept = np.ones(n, dtype=bool)
+    dups_found = []
+    
+    for i in range(n):
+        if not kept[i]:
+            continue
+        
+        dups = sim[i] >= similarity_threshold
+        dups[:i + 1] = False
+        dups &= kept
+        
+        if dups.any():
+            for j in np.flatnonzero(dups):
+                dups_found.append((j, i, sim[i, j]))
+            kept &= ~dups
+    
+    return kept, dups_found
 
 def remove_duplicate_news(news_items: list, similarity_threshold: float = 0.75) -> list:
     """
@@ -178,39 +370,31 @@ def remove_duplicate_news(news_items: list, similarity_threshold: float = 0.75)
     if not news_items:
         return []
     
-    # 점수 높은 순으로 정렬
-    sorted_items = sorted(
-        news_items, 
-        key=lambda x: x.get('relevance_score', 0), 
-        reverse=True
-    )
+    # 점수 높은 순으로 정렬 (순열은 한 번만 계산, 같은 점수는 원래 순서 유지)
+    scores = np.array([item.get('relevance_score', 0) for item in news_items])
+    order = np.argsort(-scores, kind='stable')
+    sorted_items = [news_items[i] for i in order]
     
-    unique_news = []
-    removed_count = 0
+    titles = [item.get('_norm_title') or normalize_title(item['title']) for item in sorted_items]
+    kept, dups_found = _dedup_mask(titles, similarity_threshold)
     
-    for item in sorted_items:
-        is_duplicate = False
-        
-        # 이미 선택된 뉴스들과 비교
-        for selected in unique_news:
-            similarity = calculate_title_similarity(
-                item['title'], 
-                selected['title']
-            )
-            
-            if similarity >= similarity_threshold:
-                is_duplicate = True
-                removed_count += 1
-                logger.info(
-                    f"   ⚠️ 중복 제거: '{item['title'][:40]}...' "
-                    f"(유사도: {similarity:.0%} with '{selected['title'][:30]}...')"
-                )
-                break
-        
-        if not is_duplicate:
-            unique_news.append(item)
+    # (중복 제목, 유지된 제목, 유사도) - 루프가 끝난 뒤 한 번에 출력
+    dup_log = [
+        (sorted_items[j]['title'], sorted_items[i]['title'], score)
+        for j, i, score in dups_found
+    ]
     
-    logger.info(f"✅ 중복 제거 완료: {len(sorted_items)}개 → {len(unique_news)}개 (중복 {removed_count}개 제거)")
+    unique_news = [sorted_items[i] for i in np.flatnonzero(kept)]
+    
+    if dup_log and logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "   ⚠️ 중복 %d건: %s", len(dup_log),
+            "; ".join(f"'{dup[:40]}...' (유사도: {score:.0%} with '{kept_title[:30]}...')"
+                      for dup, kept_title, score in dup_log)
+        )
+    
+    logger.info("✅ 중복 제거 완료: %d개 → %d개 (중복 %d개 제거)",
+                len(sorted_items), len(unique_news), len(dup_log))
     
     return unique_news
 
@@ -221,15 +405,18 @@ def remove_duplicate_news(news_items: list, similarity_threshold: float = 0.75)
 async def auto_crawl():
     """자동 크롤링 메인 로직"""
     stats = CrawlStats()
-    stats.start_time = datetime.now()
+    stats.start()
     
     logger.info("=" * 70)
-    logger.info(f"⏰ 자동 크롤링 시작: {stats.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
+    logger.info("⏰ 자동 크롤링 시작: %s", stats.start_time.strftime('%Y-%m-%d %H:%M:%S'))
     logger.info("=" * 70)
     
     try:
         # 1. 초기화
         logger.info("🔧 초기화 중...")
+        if OPENAI_USE_BATCH_API:
+            # 필터/요약 배치가 나눠 쓰는 전체 대기 예산 (크론 주기를 넘기지 않도록)
+            start_batch_budget()
         csv_success = init_csv_file()
         gsheet_success = init_google_sheets()
         
@@ -244,39 +431,42 @@ async def auto_crawl():
         logger.info("   검색어: 부동산")
         logger.info("   요청 개수: 20개")
         
-        news_items = search_naver_news("부동산", display=20)
+        news_items = await search_naver_news("부동산", display=20, use_batch_api=OPENAI_USE_BATCH_API)
         
         if not news_items or len(news_items) == 0:
             logger.warning("")
             logger.warning("⚠️ 수집된 뉴스 없음")
             logger.warning("   원인: 네이버 API 오류 또는 필터링 결과 0개")
-            stats.end_time = datetime.now()
+            stats.stop()
             stats.print_summary()
             return
         
+        # 정규화 제목은 한 번만 계산 (중복 제거와 DB 중복 체크에서 재사용)
+        for item in news_items:
+            item['_norm_title'] = normalize_title(item['title'])
+        
         stats.total_fetched = 20  # 네이버 API 요청 개수
         stats.total_filtered = len(news_items)  # 필터링 후 개수
         
         logger.info("")
-        logger.info(f"✅ {len(news_items)}개 부동산 관련 뉴스 발견")
+        logger.info("✅ %d개 부동산 관련 뉴스 발견", len(news_items))
         
         # 상위 3개 뉴스 미리보기
-        logger.info("")
-        logger.info("📰 상위 3개 뉴스:")
-        for idx, item in enumerate(news_items[:3]):
-            logger.info(f"   [{idx+1}] {item['title'][:50]}...")
-            logger.info(f"       점수: {item.get('relevance_score', 0)}점 | "
-                       f"지역: {item.get('region', 'N/A')} | "
-                       f"키워드: {', '.join(item.get('keywords', [])[:3])}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("")
+            logger.info("📰 상위 3개 뉴스:")
+            for idx, item in enumerate(news_items[:3]):
+                logger.info("   [%d] %s...\n       점수: %s점 | 지역: %s | 키워드: %s",
+                            idx + 1, item['title'][:50], item.get('relevance_score', 0),
+                            item.get('region', 'N/A'), ', '.join(item.get('keywords', [])[:3]))
         
         # 3. 뉴스 요약 생성 (크롤러 전용)
         logger.info("")
         logger.info("📝 뉴스 요약 생성 중...")
-        for idx, item in enumerate(news_items):
-            original_desc = item['description']
-            summary = generate_news_summary(item['title'], original_desc)
+        summaries = await generate_news_summaries_batch(news_items)
+        for item, summary in zip(news_items, summaries):
             item['description'] = summary
-            logger.info(f"   [{idx+1}/{len(news_items)}] 요약 완료: {item['title'][:40]}...")
+        logger.info("   ✅ 요약 완료: %d개", len(news_items))
         
         # 4. 중복 뉴스 제거 (제목 유사도 기반)
         logger.info("")
@@ -286,18 +476,18 @@ async def auto_crawl():
         
         # 중복 제거 후 통계 업데이트
         if len(news_items) < original_count:
-            logger.info(f"   📊 중복 제거: {original_count}개 → {len(news_items)}개")
+            logger.info("   📊 중복 제거: %d개 → %d개", original_count, len(news_items))
         else:
-            logger.info(f"   ✅ 중복 없음: {len(news_items)}개 유지")
+            logger.info("   ✅ 중복 없음: %d개 유지", len(news_items))
         
-        # 5. DB 중복 체크 (최근 3시간 URL + 최근 24시간 제목 확인)
+        # 5. DB 중복 체크 (최근 24시간 URL + 최근 24시간 제목 확인)
         logger.info("")
         logger.info("🔍 DB 중복 확인 중 (URL + 제목)...")
         
-        # URL 중복 체크 (최근 3시간)
-        recent_urls = get_recent_urls_from_gsheet(hours=3)
-        # 제목 중복 체크 (최근 24시간)
-        recent_titles = get_recent_titles_from_gsheet(hours=24)
+        # 최근 24시간 행을 시트에서 한 번만 읽어 URL 인덱스와 제목 목록을 함께 구성
+        recent_titles = frozenset(await asyncio.to_thread(load_recent_index, 24))
+        # 근사 중복 제목 체크 (같은 최근 24시간 제목으로 인덱스 구성)
+        title_index = TitleIndex(recent_titles)
         
         before_db_check = len(news_items)
         new_news_items = []
@@ -306,17 +496,21 @@ async def auto_crawl():
         for item in news_items:
             # URL 체크
             url = item.get('link') or item.get('url', '')
-            if url and url in recent_urls:
+            if url and is_url_recent(url):
                 duplicate_count += 1
-                logger.info(f"   ⚠️ URL 중복: '{item['title'][:40]}...' (이미 저장된 URL)")
+                logger.info("   ⚠️ URL 중복: '%s...' (이미 저장된 URL)", item['title'][:40])
                 continue
             
             # 제목 체크 (정규화)
-            title = item.get('title', '')
-            normalized_title = title.lower().strip().replace(' ', '')
+            normalized_title = item['_norm_title']
             if normalized_title and normalized_title in recent_titles:
                 duplicate_count += 1
-                logger.info(f"   ⚠️ 제목 중복: '{item['title'][:40]}...' (이미 저장된 제목)")
+                logger.info("   ⚠️ 제목 중복: '%s...' (이미 저장된 제목)", item['title'][:40])
+                continue
+            
+            if title_index.is_near_duplicate(normalized_title):
+                duplicate_count += 1
+                logger.info("   ⚠️ 유사 제목 중복: '%s...' (이미 저장된 제목과 유사)", item['title'][:40])
                 continue
             
             # 중복이 아니면 추가
@@ -325,16 +519,16 @@ async def auto_crawl():
         news_items = new_news_items
         
         if duplicate_count > 0:
-            logger.info(f"   📊 DB 중복 제거: {before_db_check}개 → {len(news_items)}개 (중복 {duplicate_count}개)")
+            logger.info("   📊 DB 중복 제거: %d개 → %d개 (중복 %d개)", before_db_check, len(news_items), duplicate_count)
         else:
-            logger.info(f"   ✅ DB 중복 없음: {len(news_items)}개 모두 신규")
+            logger.info("   ✅ DB 중복 없음: %d개 모두 신규", len(news_items))
         
         # 저장할 뉴스가 없으면 종료
         if len(news_items) == 0:
             logger.warning("")
             logger.warning("⚠️ 저장할 신규 뉴스 없음")
-            logger.warning("   원인: 모두 최근 3시간 내 저장된 뉴스")
-            stats.end_time = datetime.now()
+            logger.warning("   원인: 모두 최근 24시간 내 저장된 뉴스")
+            stats.stop()
             stats.print_summary()
             return
         
@@ -346,7 +540,7 @@ async def auto_crawl():
         stats.total_saved = len(news_items)
         
         # 7. 완료
-        stats.end_time = datetime.now()
+        stats.stop()
         logger.info("")
         logger.info("🎉 크롤링 완료!")
         stats.print_summary()
@@ -358,17 +552,16 @@ async def auto_crawl():
         
     except Exception as e:
         logger.error("")
-        logger.error(f"❌ 크롤링 실패: {type(e).__name__}")
-        logger.error(f"   에러 메시지: {e}")
+        logger.error("❌ 크롤링 실패: %s", type(e).__name__)
+        logger.error("   에러 메시지: %s", e)
         
-        import traceback
         logger.error("")
         logger.error("📋 상세 에러 로그:")
         for line in traceback.format_exc().split('\n'):
             if line.strip():
-                logger.error(f"   {line}")
+                logger.error("   %s", line)
         
-        stats.end_time = datetime.now()
+        stats.stop()
         stats.print_summary()
         sys.exit(1)  # 에러 발생 시 종료 코드 1
 